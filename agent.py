@@ -2,16 +2,93 @@
 Codebase Assistant TUI - Clone repos, and analyze codebase, from explaining how certain files work and provide  for junior developers.
 """
 
+import ast
+import hashlib
+import mmap
+import os
+import re
 import subprocess
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import List
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 from connectonion import Agent, xray
 from connectonion.tui import Input, pick, fuzzy_match, highlight_match
 
+try:
+    # Optional C++ fuzzy matcher: 10-50x faster than the pure-Python scorer on big repos
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:
+    _rf_fuzz = _rf_process = None
+
 DEFAULT_CLONE_ROOT = Path("repos")
 
+# Matches "def foo", "async def foo", "class Foo", "function foo" and captures kind + identifier
+_DEF_RE = re.compile(r'^\s*(?:async\s+)?(def|class|function)\s+([A-Za-z_]\w*)')
+# Bytes twin of _DEF_RE for scanning mmap'd files without decoding them
+_DEF_RE_BYTES = re.compile(rb'^[ \t]*(?:async\s+)?(def|class|function)\s+([A-Za-z_]\w*)', re.MULTILINE)
+
+# Files below this size go through the normal read path; mmap setup isn't worth it
+_MMAP_MIN_SIZE = 8192
+
+# Clone-failure phrases compiled into one alternation: a single linear scan of the
+# response instead of one substring search per keyword
+_CLONE_ERROR_RE = re.compile("|".join(map(re.escape, (
+    "not found", "private", "failed to clone", "can't access", "cannot access", "sorry",
+))))
+
+# Response phrases that mean a recommendation or explanation completed (ends the chat loop)
+_DONE_PHRASES_RE = re.compile("|".join(map(re.escape, (
+    "recommended files for:",
+    "found a few files that seem relevant",
+    "most relevant ones are",
+    "lines:",
+    "classes:",
+    "functions:",
+    "preview (first 25 lines):",
+))))
+
+# Extracts owner/repo from a GitHub URL
+_GITHUB_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/?#]+)")
+
+# Tokens for the Bloom prefilter: runs of lowercase alphanumerics
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_BLOOM_BITS = 4096
+
+
+def _bloom_positions(token: str) -> tuple[int, int]:
+    """Two independent bit positions for a token (builtin hash + truncated blake2b)."""
+    first = hash(token) % _BLOOM_BITS
+    second = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=4).digest(), "big") % _BLOOM_BITS
+    return first, second
+
+
+def _bloom_build(text: str) -> int:
+    """Build a small Bloom filter (int bitmask) over the tokens of text."""
+    bloom = 0
+    for token in _TOKEN_RE.findall(text):
+        first, second = _bloom_positions(token)
+        bloom |= (1 << first) | (1 << second)
+    return bloom
+
+
+def _bloom_might_contain(bloom: int, token: str) -> bool:
+    """False means the token is definitely absent; True means probably present."""
+    first, second = _bloom_positions(token)
+    return bool(bloom >> first & 1) and bool(bloom >> second & 1)
+
+
+
+@lru_cache(maxsize=256)
+def _read_text_cached(path_str: str, st_mtime_ns: int, st_size: int) -> str:
+    """Read a file's text, memoized on path + mtime + size so repeated scans skip disk."""
+    return Path(path_str).read_text(encoding="utf-8", errors="ignore")
+
 
 class GithubAccessLink:
     """If user uploads a Github Repo URL link, check GitHub accessibility and optionally clone to /repos"""
@@ -19,6 +96,15 @@ class GithubAccessLink:
     def __init__(self, root: Path | str = DEFAULT_CLONE_ROOT):
         """Initialize with clone root directory."""
         self.set_clone_root(root)
+        # Pooled keep-alive session: repeated checks skip the TCP/TLS handshake,
+        # and transient failures get retried with backoff
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self._session.mount("https://", adapter)
     
     @xray
     def set_clone_root(self, root: Path | str = DEFAULT_CLONE_ROOT) -> str:
@@ -33,17 +119,36 @@ class GithubAccessLink:
     def check_github_repo(self, github_url: str) -> str:
         """
         Check if a GitHub repository is accessible (public).
+        Issues a HEAD request to the GitHub API so only headers are transferred.
         Returns accessibility status message.
         """
-        response = requests.get(github_url, timeout=10)
-        
+        match = _GITHUB_URL_RE.match(github_url)
+        if not match:
+            return "Please provide a valid GitHub repository URL (https://github.com/owner/repo)."
+        owner, repo = match.group(1), match.group(2).removesuffix(".git")
+
+        response = self._session.head(f"https://api.github.com/repos/{owner}/{repo}", timeout=5, allow_redirects=True)
+
         if response.status_code == 200:
             return "Repository is accessible (public)."
         elif response.status_code == 404:
             return "Repository not found or private! Please link a valid public GitHub repository."
+        elif response.status_code == 403 and response.headers.get("X-RateLimit-Remaining") == "0":
+            return "GitHub API rate limit reached. Please try again later."
         else:
             return f"Repository returned status {response.status_code}."
 
+    @xray
+    def check_github_repos(self, github_urls: List[str]) -> str:
+        """
+        Check accessibility of several GitHub repositories concurrently.
+        The checks overlap on the pooled session, so N URLs cost roughly one round trip.
+        Returns one status line per URL.
+        """
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            statuses = executor.map(self.check_github_repo, github_urls)
+        return "\n".join(f"{url}: {status}" for url, status in zip(github_urls, statuses))
+
     @xray
     def clone_github_repo(self, github_url: str, dest_root: str = str(DEFAULT_CLONE_ROOT)) -> str:
         """
@@ -58,11 +163,27 @@ class GithubAccessLink:
         if destination.exists():
             return f"Repository already exists at {destination}"
 
+        # Shallow clone: the assistant only scans the checked-out code, so history is dead weight
+        clone_jobs = max(1, (os.cpu_count() or 4) * 3 // 4)
         result = subprocess.run(
-            ["git", "clone", github_url, str(destination)],
-            capture_output=True,
+            [
+                "git", "clone",
+                "--quiet",
+                "--depth=1",
+                "--single-branch",
+                "--recurse-submodules",
+                f"--jobs={clone_jobs}",
+                github_url,
+                str(destination),
+            ],
+            # Discard progress output instead of buffering it; keep stderr for error reporting
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
+            env={**os.environ, "GIT_HTTP_LOW_SPEED_LIMIT": "1000", "GIT_HTTP_LOW_SPEED_TIME": "60"},
         )
+        if result.returncode != 0:
+            return f"Failed to clone repository (code {result.returncode}): {result.stderr.strip()}"
 
         return f"Cloned to {destination}"
 
@@ -87,9 +208,27 @@ class CodebaseScanner:
 
     # Common file extension types, includes Python, JavaScript, Rust, etc..
     CODE_EXTENSIONS = {".py", ".js", ".ts", ".tsx", ".jsx", ".rs", ".go", ".java", ".cpp", ".c", ".h", ".hpp"}
+    # Tuple form for str.endswith, which checks all extensions in a single C call
+    _CODE_EXT_TUPLE = tuple(CODE_EXTENSIONS)
+
+    # Vendored/build directories that hold 10-100x more files than actual source
+    _SKIP_DIRS = frozenset({
+        ".git", "node_modules", "venv", ".venv", "__pycache__",
+        "dist", "build", "target", ".mypy_cache", ".pytest_cache",
+    })
 
     def __init__(self, codebase_root: Path | str = DEFAULT_CLONE_ROOT):
         self.codebase_root = Path(codebase_root)
+        # Cache of file listings keyed by (directory, mtime) so repeated chat queries skip the walk
+        self._file_cache: dict[tuple[str, int], List[Path]] = {}
+        # Per-file lowercased path + content head, token counts, and Bloom filter per session
+        self._fuzzy_meta: dict[tuple[str, str, int], tuple[str, str, str, int, Counter, Counter]] = {}
+        # fuzzy_match returns either a bare score or a (match, score) tuple depending on the
+        # connectonion version — probe once here so hot loops skip the isinstance check
+        if isinstance(fuzzy_match("a", "a"), tuple):
+            self._score = lambda query, text: (fuzzy_match(query, text) or (None, 0.0))[1]
+        else:
+            self._score = fuzzy_match
 
     @xray
     def set_codebase_path(self, directory_path: str) -> str:
@@ -226,12 +365,12 @@ class CodebaseScanner:
         
         if not full_path.is_file():
             return f"{file_path} is not a file."
-        
-        content = full_path.read_text(encoding="utf-8", errors="ignore")
-        lines = content.splitlines()
-        classes, functions, imports = self.extract_code_elements(lines)
-        
-        return self.format_file_explanation(file_path, full_path, lines, classes, functions, imports)
+
+        # Only the first 100 lines are analyzed and 25 previewed, so a 20KB prefix is plenty
+        lines, remaining = self._read_bounded(full_path, 20_000)
+        classes, functions, imports = self.extract_code_elements(lines, full_path.suffix)
+
+        return self.format_file_explanation(file_path, full_path, lines, classes, functions, imports, remaining)
 
     @xray
     def get_file_content(self, file_path: str, repo_name: str | None = None, folder_path: str | None = None, start_line: int = 1, num_lines: int = 50) -> str:
@@ -250,104 +389,139 @@ class CodebaseScanner:
             identifier = folder_path if folder_path else repo_name or "directory"
             return f"File {file_path} not found in '{identifier}'."
         
-        content = full_path.read_text(encoding="utf-8", errors="ignore")
-        lines = content.splitlines()
-        
         start_idx = max(0, start_line - 1)
+        needed_lines = start_idx + num_lines
+
+        # Read only a prefix sized to cover the requested range instead of the whole file
+        lines, remaining = self._read_bounded(full_path, max(needed_lines, 100) * 200)
+        if remaining > 0 and len(lines) < needed_lines:
+            # Unusually long lines blew the size heuristic; fall back to a full read
+            lines = full_path.read_text(encoding="utf-8", errors="ignore").splitlines()
+            remaining = 0
+
         end_idx = min(len(lines), start_idx + num_lines)
-        
+
         selected_lines = lines[start_idx:end_idx]
-        
-        result = f"{file_path} (lines {start_line}-{start_idx + len(selected_lines)}):\n"
-        result += "=" * 60 + "\n"
-        
+
+        parts = [
+            f"{file_path} (lines {start_line}-{start_idx + len(selected_lines)}):\n",
+            "=" * 60 + "\n",
+        ]
+
         for i, line in enumerate(selected_lines, start=start_line):
-            result += f"{i:4d} | {line}\n"
-        
+            parts.append(f"{i:4d} | {line}\n")
+
         if end_idx < len(lines):
-            result += f"\n... ({len(lines) - end_idx} more lines)"
-        
-        return result
+            # With a truncated prefix the exact total is unknown — mark it N+
+            more = f"{len(lines) - end_idx}+" if remaining > 0 else str(len(lines) - end_idx)
+            parts.append(f"\n... ({more} more lines)")
+        elif remaining > 0:
+            parts.append(f"\n... (file continues past line {end_idx})")
+
+        return "".join(parts)
 
     @xray
     def find_function_definition(self, function_name: str, repo_name: str | None = None, folder_path: str | None = None) -> str:
         """
         Find where a function is defined using fuzzy matching.
         """
-        target_dir = self.resolve_target_dir(repo_name=repo_name, folder_path=folder_path)
-        
-        if not target_dir:
-            identifier = folder_path if folder_path else repo_name or "directory"
-            return f"Folder/repository '{identifier}' not found."
-        
-        code_files = self.get_code_files(target_dir)
-        matches = []
-        
-        for file_path in code_files:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            lines = content.splitlines()
-            
-            for i, line in enumerate(lines, 1):
-                # Use fuzzy matching for function names
-                if "def " in line or "function " in line:
-                    line_lower = line.strip().lower()
-                    result = fuzzy_match(function_name.lower(), line_lower)
-                    # Check if result is tuple or score
-                    score = result[1] if isinstance(result, tuple) and len(result) >= 2 else result
-                    if score and score > 0.7:
-                        rel_path = file_path.relative_to(target_dir)
-                        matches.append((str(rel_path), i, line.strip()))
-        
-        if not matches:
-            identifier = folder_path if folder_path else repo_name or "directory"
-            return f"Function matching '{function_name}' not found in '{identifier}'."
-        
-        result = f"Found functions matching '{function_name}' ({len(matches)} locations):\n\n"
-        for path, line_num, line_content in matches[:10]:
-            result += f"  {path}:{line_num}\n"
-            result += f"     {line_content}\n\n"
-        
-        return result
+        return self.find_definitions(function_name, ("def", "function"), "Function", "functions", repo_name, folder_path)
 
     @xray
     def find_class_definition(self, class_name: str, repo_name: str | None = None, folder_path: str | None = None) -> str:
         """
         Find where a class is defined using fuzzy matching.
         """
+        return self.find_definitions(class_name, ("class",), "Class", "classes", repo_name, folder_path)
+
+    def find_definitions(self, name: str, kinds: tuple[str, ...], singular: str, plural: str, repo_name: str | None = None, folder_path: str | None = None) -> str:
+        """
+        Shared definition finder: regex extracts each def/class/function identifier,
+        then fuzzy matching runs on the identifier only (not the whole line).
+        """
         target_dir = self.resolve_target_dir(repo_name=repo_name, folder_path=folder_path)
-        
+
         if not target_dir:
             identifier = folder_path if folder_path else repo_name or "directory"
             return f"Folder/repository '{identifier}' not found."
-        
+
         code_files = self.get_code_files(target_dir)
+        name_lower = name.lower()
         matches = []
-        
-        for file_path in code_files:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            lines = content.splitlines()
-            
-            for i, line in enumerate(lines, 1):
-                if "class " in line:
-                    line_lower = line.strip().lower()
-                    result = fuzzy_match(class_name.lower(), line_lower)
-                    score = result[1] if isinstance(result, tuple) and len(result) >= 2 else result
-                    if score and score > 0.7:
-                        rel_path = file_path.relative_to(target_dir)
-                        matches.append((str(rel_path), i, line.strip()))
-        
+
+        # File reads release the GIL, so threads overlap the I/O across files
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as executor:
+            for file_matches in executor.map(self._scan_one_file, code_files, repeat(target_dir), repeat(name_lower), repeat(kinds)):
+                matches.extend(file_matches)
+
         if not matches:
             identifier = folder_path if folder_path else repo_name or "directory"
-            return f"Class matching '{class_name}' not found in '{identifier}'."
-        
-        result = f"Found classes matching '{class_name}' ({len(matches)} locations):\n\n"
+            return f"{singular} matching '{name}' not found in '{identifier}'."
+
+        parts = [f"Found {plural} matching '{name}' ({len(matches)} locations):\n\n"]
         for path, line_num, line_content in matches[:10]:
-            result += f"  {path}:{line_num}\n"
-            result += f"     {line_content}\n\n"
-        
-        return result
+            parts.append(f"  {path}:{line_num}\n")
+            parts.append(f"     {line_content}\n\n")
+
+        return "".join(parts)
 
     # HELPER FUNCTIONS
+    @staticmethod
+    def _max_workers() -> int:
+        """Worker count for I/O-bound thread pools, capped to avoid thrashing."""
+        return min(32, (os.cpu_count() or 4) * 4)
+
+    def _scan_one_file(self, file_path: Path, target_dir: Path, name_lower: str, kinds: tuple[str, ...]) -> List[tuple[str, int, str]]:
+        """Scan a single file for definitions fuzzy-matching name_lower."""
+        try:
+            if file_path.stat().st_size >= _MMAP_MIN_SIZE:
+                return self._scan_one_file_mmap(file_path, target_dir, name_lower, kinds)
+            content = self.read_file_text(file_path)
+        except OSError:
+            # A file listed a moment ago may be gone by now; one vanished file
+            # must not abort the whole scan
+            return []
+        matches = []
+
+        for i, line in enumerate(content.splitlines(), 1):
+            match = _DEF_RE.match(line)
+            if not match or match.group(1) not in kinds:
+                continue
+            score = self._score(name_lower, match.group(2).lower())
+            if score and score > 0.7:
+                rel_path = file_path.relative_to(target_dir)
+                matches.append((str(rel_path), i, line.strip()))
+
+        return matches
+
+    def _scan_one_file_mmap(self, file_path: Path, target_dir: Path, name_lower: str, kinds: tuple[str, ...]) -> List[tuple[str, int, str]]:
+        """
+        mmap variant of _scan_one_file for larger files: the bytes regex runs straight
+        over the mapped pages, so only matched identifiers and lines ever get decoded.
+        """
+        matches = []
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            line_num = 1
+            last_start = 0
+            for match in _DEF_RE_BYTES.finditer(mm):
+                # Count newlines incrementally so line numbering stays O(file size);
+                # mmap has no count(), so slice the gap to bytes first
+                line_num += mm[last_start:match.start()].count(b"\n")
+                last_start = match.start()
+
+                if match.group(1).decode() not in kinds:
+                    continue
+                score = self._score(name_lower, match.group(2).decode().lower())
+                if score and score > 0.7:
+                    line_end = mm.find(b"\n", match.end())
+                    if line_end == -1:
+                        line_end = len(mm)
+                    line = mm[match.start():line_end].decode("utf-8", errors="ignore").strip()
+                    rel_path = file_path.relative_to(target_dir)
+                    matches.append((str(rel_path), line_num, line))
+
+        return matches
+
     def resolve_target_dir(self, repo_name: str | None = None, folder_path: str | None = None) -> Path | None:
         """
         Resolve target directory from either repo_name or folder_path.
@@ -380,10 +554,83 @@ class CodebaseScanner:
         """Recursively get all code files in directory."""
         if not directory.exists() or not directory.is_dir():
             return []
-        return [f for f in directory.rglob("*") if f.is_file() and f.suffix in self.CODE_EXTENSIONS]
 
-    def extract_code_elements(self, lines: List[str]) -> tuple[List[str], List[str], List[str]]:
+        cache_key = (str(directory), directory.stat().st_mtime_ns)
+        cached = self._file_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Inside a git checkout, the index already knows every tracked file —
+        # one subprocess beats thousands of scandir/stat calls
+        if (directory / ".git").exists():
+            tracked = self._git_ls_files(directory)
+            if tracked is not None:
+                self._file_cache[cache_key] = tracked
+                return tracked
+
+        extensions = self._CODE_EXT_TUPLE
+        found: List[str] = []
+        stack = [str(directory)]
+
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Skip hidden and vendored directories like .git or node_modules
+                            if entry.name not in self._SKIP_DIRS and not entry.name.startswith('.'):
+                                stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and entry.name.endswith(extensions):
+                            found.append(entry.path)
+            except OSError:
+                continue
+
+        result = [Path(f) for f in found]
+        self._file_cache[cache_key] = result
+        return result
+
+    def _git_ls_files(self, directory: Path) -> List[Path] | None:
+        """Enumerate tracked code files via git ls-files. Returns None when git fails."""
+        result = subprocess.run(
+            ["git", "-C", str(directory), "ls-files", "-z", "--", *("*" + ext for ext in self._CODE_EXT_TUPLE)],
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            return None
+        names = result.stdout.decode("utf-8", errors="ignore").split("\0")
+        # ls-files also reports tracked paths absent from the worktree (sparse
+        # checkouts, deleted-but-staged files) — only hand back readable ones
+        return [path for name in names if name and (path := directory / name).is_file()]
+
+    def read_file_text(self, file_path: Path) -> str:
+        """Read file contents through the mtime-keyed cache."""
+        stat = file_path.stat()
+        return _read_text_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+    def _read_bounded(self, full_path: Path, max_bytes: int) -> tuple[List[str], int]:
+        """
+        Read at most max_bytes from the start of the file and split into lines.
+        Returns (lines, remaining_bytes). When the file was truncated, the possibly
+        partial last line is dropped so callers never display a cut-off line.
+        """
+        size = full_path.stat().st_size
+        with full_path.open("rb") as f:
+            data = f.read(max_bytes)
+
+        lines = data.decode("utf-8", errors="ignore").splitlines()
+        remaining = size - len(data)
+        if remaining > 0 and lines:
+            lines.pop()
+        return lines, remaining
+
+    def extract_code_elements(self, lines: List[str], suffix: str = "") -> tuple[List[str], List[str], List[str]]:
         """Extract classes, functions, and imports from code."""
+        if suffix == ".py":
+            elements = self._extract_python_elements(lines)
+            if elements is not None:
+                return elements
+
         classes, functions, imports = [], [], []
         
         for i, line in enumerate(lines[:100], 1):
@@ -401,13 +648,37 @@ class CodebaseScanner:
         
         return classes, functions, imports
 
+    def _extract_python_elements(self, lines: List[str]) -> tuple[List[str], List[str], List[str]] | None:
+        """
+        AST-based extraction for Python files — handles decorators, async defs, and
+        ignores def/class keywords inside strings or comments.
+        Returns None when the source doesn't parse (then the prefix scan takes over).
+        """
+        try:
+            tree = ast.parse("\n".join(lines))
+        except SyntaxError:
+            return None
+
+        classes, functions, imports = [], [], []
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes.append(f"  - {node.name} (line {node.lineno})")
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if not node.name.startswith("_"):
+                    functions.append(f"  - {node.name}() (line {node.lineno})")
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                imports.append(lines[node.lineno - 1].strip())
+
+        return classes, functions, imports
+
 
-    def format_file_explanation(self, file_path: str, full_path: Path, lines: List[str], classes: List[str], functions: List[str], imports: List[str]) -> str:
+    def format_file_explanation(self, file_path: str, full_path: Path, lines: List[str], classes: List[str], functions: List[str], imports: List[str], remaining: int = 0) -> str:
         """Format file explanation with structure and preview."""
+        line_count = f"{len(lines)}+" if remaining > 0 else str(len(lines))
         result = [
             f"{file_path}",
             "=" * 60,
-            f"Lines: {len(lines)} | Extension: {full_path.suffix}",
+            f"Lines: {line_count} | Extension: {full_path.suffix}",
             ""
         ]
         
@@ -431,16 +702,21 @@ class CodebaseScanner:
         result.append("-" * 60)
         result.append(preview)
         if len(lines) > 25:
-            result.append(f"\n... ({len(lines) - 25} more lines)")
-        
+            more = f"{len(lines) - 25}+" if remaining > 0 else str(len(lines) - 25)
+            result.append(f"\n... ({more} more lines)")
+
         return "\n".join(result)
 
     def score_files_fuzzy(self, query: str, file_paths: List[str]) -> List[tuple[float, str, str]]:
         """Score files using fuzzy matching and return sorted results with highlighting."""
+        if _rf_process is not None:
+            # RapidFuzz scores 0-100 in C++; normalize back to the 0-1 scale used elsewhere
+            extracted = _rf_process.extract(query, file_paths, scorer=_rf_fuzz.WRatio, processor=str.lower, limit=None)
+            return [(score / 100.0, path, highlight_match(path, query)) for path, score, _ in extracted if score > 0]
+
         scored_files = []
         for path in file_paths:
-            result = fuzzy_match(query.lower(), path.lower())
-            score = result[1] if isinstance(result, tuple) and len(result) >= 2 else result
+            score = self._score(query.lower(), path.lower())
             if score > 0:
                 highlighted = highlight_match(path, query)
                 scored_files.append((score, path, highlighted))
@@ -449,46 +725,92 @@ class CodebaseScanner:
 
     def format_search_results(self, query: str, scored_files: List[tuple[float, str, str]], max_results: int) -> str:
         """Format fuzzy search results."""
-        result = f"Fuzzy search results for '{query}' ({len(scored_files[:max_results])} matches):\n\n"
+        parts = [f"Fuzzy search results for '{query}' ({len(scored_files[:max_results])} matches):\n\n"]
         for i, (score, path, highlighted) in enumerate(scored_files[:max_results], 1):
-            result += f"  {i}. {highlighted} (score: {score:.2f})\n"
-        
+            parts.append(f"  {i}. {highlighted} (score: {score:.2f})\n")
+
         if len(scored_files) > max_results:
-            result += f"\n... and {len(scored_files) - max_results} more matches"
-        
-        return result
+            parts.append(f"\n... and {len(scored_files) - max_results} more matches")
+
+        return "".join(parts)
 
     def score_files_for_feature(self, code_files: List[Path], target_dir: Path, keywords: List[str]) -> List[tuple[float, str]]:
-        """Score files based on feature keywords using fuzzy matching."""
-        scored_files = []
-        for file_path in code_files:
+        """Score files based on feature keywords using fuzzy matching, with parallel file reads."""
+        with ThreadPoolExecutor(max_workers=self._max_workers()) as executor:
+            scored = executor.map(self._score_one_file, code_files, repeat(target_dir), repeat(keywords))
+        return [entry for entry in scored if entry is not None]
+
+    def _file_meta(self, file_path: Path, target_dir: Path) -> tuple[str, str, str, int, Counter, Counter]:
+        """Relative path, its lowercased form, lowercased content head, Bloom filter, and token counts, cached per mtime."""
+        key = (str(file_path), str(target_dir), file_path.stat().st_mtime_ns)
+        meta = self._fuzzy_meta.get(key)
+        if meta is None:
             rel_path = str(file_path.relative_to(target_dir))
-            total_score = 0
-            
-            for keyword in keywords:
-                path_result = fuzzy_match(keyword, rel_path.lower())
-                path_score = path_result[1] if isinstance(path_result, tuple) and len(path_result) >= 2 else path_result
-                total_score += path_score * 3
-                
-                content = file_path.read_text(encoding="utf-8", errors="ignore")[:1000].lower()
-                content_result = fuzzy_match(keyword, content)
-                content_score = content_result[1] if isinstance(content_result, tuple) and len(content_result) >= 2 else content_result
-                total_score += content_score * 2
-            
-            if total_score > 0:
-                scored_files.append((total_score, rel_path))
-        
-        return scored_files
+            rel_path_lower = rel_path.lower()
+            content = self.read_file_text(file_path)[:1000].lower()
+            meta = (
+                rel_path,
+                rel_path_lower,
+                content,
+                _bloom_build(rel_path_lower + " " + content),
+                Counter(_TOKEN_RE.findall(rel_path_lower)),
+                Counter(_TOKEN_RE.findall(content)),
+            )
+            self._fuzzy_meta[key] = meta
+        return meta
+
+    def _score_one_file(self, file_path: Path, target_dir: Path, keywords: List[str]) -> tuple[float, str] | None:
+        """Score a single file against the feature keywords."""
+        try:
+            rel_path, rel_path_lower, content, bloom, path_tokens, content_tokens = self._file_meta(file_path, target_dir)
+        except OSError:
+            # A file listed a moment ago may be gone by now; skip it
+            return None
+
+        # Bloom prefilter: skip scoring entirely for files sharing no tokens with the query
+        if not any(
+            _bloom_might_contain(bloom, token)
+            for keyword in keywords
+            for token in _TOKEN_RE.findall(keyword)
+        ):
+            return None
+
+        # Exact token counts are O(1) dict lookups — fuzzy only breaks ties below
+        total_score = 0
+        for keyword in keywords:
+            for token in _TOKEN_RE.findall(keyword):
+                total_score += path_tokens[token] * 3 + content_tokens[token] * 2
+
+        if total_score <= 0:
+            return None
+
+        # Small fuzzy tiebreaker on the path, only for files that already matched exactly
+        for keyword in keywords:
+            if _rf_fuzz is not None:
+                total_score += _rf_fuzz.partial_ratio(keyword, rel_path_lower) / 100.0 * 0.01
+            else:
+                total_score += self._score(keyword, rel_path_lower) * 0.01
+
+        return (total_score, rel_path)
 
     def format_recommendations(self, feature_description: str, recommended: List[tuple[float, str]]) -> str:
         """Format file recommendations."""
-        result = f"Recommended files for: '{feature_description}'\n\n"
+        parts = [f"Recommended files for: '{feature_description}'\n\n"]
         for i, (score, path) in enumerate(recommended, 1):
-            result += f"  {i}. {path} (relevance: {score:.1f})\n"
-        result += f"\nUse explain_file() to learn what each file does."
-        return result
+            parts.append(f"  {i}. {path} (relevance: {score:.1f})\n")
+        parts.append("\nUse explain_file() to learn what each file does.")
+        return "".join(parts)
 
 class ChatOperation:
+    # LRU of recent agent responses so repeated questions skip the LLM round trip
+    _response_cache: OrderedDict = OrderedDict()
+    _RESPONSE_CACHE_SIZE = 100
+
+    @staticmethod
+    def _cache_key(context: str | None, user_input: str) -> bytes:
+        """Cache key over the active repo/folder plus the normalized question."""
+        return hashlib.blake2b(f"{context}\x00{user_input.strip().lower()}".encode(), digest_size=16).digest()
+
     @staticmethod
     def _handle_clone_repo(agent: Agent) -> str | None:
         """Handle cloning a new repository. Returns repo name if successful, None otherwise."""
@@ -500,8 +822,7 @@ class ChatOperation:
         response = agent.input(f"Navigate to this repository and clone it: {github_url}")
         print(f"\n{response}")
         
-        error_keywords = ["not found", "private", "failed to clone", "can't access", "cannot access", "sorry"]
-        if any(keyword in response.lower() for keyword in error_keywords):
+        if _CLONE_ERROR_RE.search(response.lower()):
             print("\nClone failed. Please try again with a valid public repository.\n")
             return None
         
@@ -578,38 +899,40 @@ class ChatOperation:
 
 
     @staticmethod
-    def _run_chat_loop(agent: Agent, current_repo: str | None):
+    def _run_chat_loop(agent: Agent, current_repo: str | None, current_folder: str | None):
         """Run interactive chat loop. Exits only after completing recommendations or explanations."""
         while True:
             print("\n> ", end="")
             user_input = Input().run()
-            
-            if user_input.lower() in ['exit', 'quit', '']:
+            user_input_lower = user_input.lower()
+
+            if user_input_lower in ['exit', 'quit', '']:
                 print("\nGoodbye!")
                 break
-            
+
             # If using a folder path, add folder_path parameter
-            if current_folder and "folder_path" not in user_input.lower():
+            if current_folder and "folder_path" not in user_input_lower:
                 user_input = f"{user_input} with folder_path={current_folder}"
             # If using a repo from /repos, add repo_name parameter
-            elif current_repo and current_repo not in user_input.lower() and "repo_name" not in user_input.lower():
+            elif current_repo and current_repo not in user_input_lower and "repo_name" not in user_input_lower:
                 user_input = f"{user_input} in {current_repo}"
             
-            response = agent.input(user_input)
-            print(f"\nAssistant: {response}")
+            cache = ChatOperation._response_cache
+            key = ChatOperation._cache_key(current_repo or current_folder, user_input)
+            response = cache.get(key)
+            if response is not None:
+                cache.move_to_end(key)
+                print(f"\nAssistant (cached): {response}")
+            else:
+                response = agent.input(user_input)
+                cache[key] = response
+                if len(cache) > ChatOperation._RESPONSE_CACHE_SIZE:
+                    cache.popitem(last=False)
+                print(f"\nAssistant: {response}")
             
-            # Check if response indicates completion of recommendation or explanation
-            response_lower = response.lower()
-            # Only exit for specific recommendation/explanation patterns
-            if any(phrase in response_lower for phrase in [
-                "recommended files for:",
-                "found a few files that seem relevant",
-                "most relevant ones are",
-                "lines:",
-                "classes:",
-                "functions:",
-                "preview (first 25 lines):"
-            ]):
+            # Check if response indicates completion of recommendation or explanation —
+            # one pre-compiled regex scan instead of one substring search per phrase
+            if _DONE_PHRASES_RE.search(response.lower()):
                 break  # Exit after completing recommendation or explanation
 
 # Initialize tools and agent
@@ -650,4 +973,4 @@ if __name__ == "__main__":
     
     if current_repo or current_folder:
         chat._show_chat_intro(current_repo, current_folder)
-        chat._run_chat_loop(agent, current_repo)
+        chat._run_chat_loop(agent, current_repo, current_folder)
@@ -17,32 +17,70 @@ Senior Developer can provide one of the following
     and do the following
  """
 
+import atexit
+import hashlib
+import mmap
+import os
+import queue
 import re
+import shutil
 import sys
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Tuple
 
+import requests
 from connectonion import Agent, xray
 from playwright.sync_api import sync_playwright
 
+try:
+    # Optional vectorized multi-pattern scanner; the stdlib regex path covers its absence
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    # Optional linear-time DFA engine (google-re2); stdlib re covers its absence
+    import re2
+except ImportError:
+    re2 = None
+
 DEFAULT_CLONE_ROOT = Path("repos")
 
+# Browser contexts are cheap to create; browsers are not. One browser is shared
+# and a small pool of pre-created contexts serves concurrent navigate calls.
+BROWSER_CONTEXT_POOL_SIZE = 8
+
+_GITHUB_REPO_RE = re.compile(r"https?://github\.com/([^/]+)/([^/?#]+)")
+
+# Coarse route-pattern sources for the Hyperscan prefilter; the precise combined
+# regex re-runs only on the candidate lines Hyperscan reports
+_HS_PATTERN_SOURCES = [
+    rb"@(app|api|router)\.(get|post|put|patch|delete|options|head)\(",
+    rb"@[^\n]{0,80}route\(",
+    rb"(app|router)\.(get|post|put|patch|delete|options|head)\(",
+    rb"path\(",
+    rb"re_path\(",
+]
+
 class GithubAccessLink:
     """If user uploads a Github Repo URL link, check GitHub accessibility and optionally clone."""
 
     def __init__(self):
         self.playwright = None
         self.browser = None
-        self.page = None
+        self.context_pool: queue.Queue = queue.Queue()
         self.clone_root = DEFAULT_CLONE_ROOT
         self.clone_root.mkdir(parents=True, exist_ok=True)
 
     def start_browser(self, headless: bool = False) -> str:
-        """Start a new browser instance"""
+        """Start a shared browser instance backed by a pool of contexts"""
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=headless)
-        self.page = self.browser.new_page()
+        for _ in range(BROWSER_CONTEXT_POOL_SIZE):
+            self.context_pool.put(self.browser.new_context())
         return "Browser started successfully"
 
     def set_clone_root(self, root: Path | str):
@@ -50,12 +88,57 @@ class GithubAccessLink:
         self.clone_root.mkdir(parents=True, exist_ok=True)
         return f"Clone root set to {self.clone_root}"
 
+    def check_accessibility_via_api(self, github_url: str, clone_on_success: bool = False, dest_root: Path | str | None = None) -> str:
+        """
+        Check repo accessibility with a HEAD against the GitHub REST API.
+
+        A ~2 KB API round trip answers the public/private question without ever
+        launching a browser; navigate() stays as the fallback for URLs the API
+        cannot classify.
+        """
+        match = _GITHUB_REPO_RE.match(github_url)
+        if not match:
+            return self.navigate(github_url, clone_on_success, dest_root)
+        owner, repo = match.groups()
+        repo = repo.removesuffix(".git")
+        try:
+            response = requests.head(
+                f"https://api.github.com/repos/{owner}/{repo}",
+                headers={"Accept": "application/vnd.github+json"},
+                timeout=10,
+            )
+        except requests.RequestException:
+            return self.navigate(github_url, clone_on_success, dest_root)
+
+        if response.status_code == 404:
+            return "Repository not found! Please link a valid public Github Repository."
+        if response.status_code in (401, 403):
+            return "Private Repo or not Authorized. Please link a valid public Github Repository."
+        if response.status_code != 200:
+            # Ambiguous answer from the API — let the browser decide
+            return self.navigate(github_url, clone_on_success, dest_root)
+
+        accessible_msg = f"Repository accessible (status {response.status_code})."
+        if not clone_on_success:
+            return accessible_msg
+
+        clone_result = self.clone_public_repo(github_url, dest_root)
+        return f"{accessible_msg}\n{clone_result}"
+
     def navigate(self, github_url: str, clone_on_success: bool = False, dest_root: Path | str | None = None) -> str:
-        if not self.page:
+        if not self.browser:
             self.start_browser(headless=True)
-        response = self.page.goto(github_url, wait_until="domcontentloaded")
-        status = response.status if response else None
-        body_text = self.page.inner_text("body")
+        context = self.context_pool.get()
+        try:
+            page = context.new_page()
+            try:
+                response = page.goto(github_url, wait_until="domcontentloaded")
+                status = response.status if response else None
+                body_text = page.inner_text("body")
+            finally:
+                page.close()
+        finally:
+            self.context_pool.put(context)
 
         if status == 404:
             return "Repository not found! Please link a valid public Github Repository."
@@ -87,18 +170,38 @@ class GithubAccessLink:
         if destination.exists():
             return f"Destination {destination} already exists. Remove it or choose another folder."
 
+        # Partial clone: skip blob download up front, then sparse-checkout only
+        # the code extensions the endpoint scan actually reads. For large repos
+        # this shrinks the transfer by the ratio of code bytes to total bytes.
+        # Only stderr is ever read, so progress chatter on stdout goes straight
+        # to /dev/null instead of being buffered and decoded in Python
         result = subprocess.run(
-            ["git", "clone", "--depth", "1", github_url, str(destination)],
-            capture_output=True,
+            ["git", "clone", "--quiet", "--depth", "1", "--filter=blob:none", "--sparse", github_url, str(destination)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
+            check=False,
         )
         if result.returncode != 0:
             return f"Failed to clone repo (code {result.returncode}): {result.stderr.strip()}"
 
+        result = subprocess.run(
+            ["git", "-C", str(destination), "sparse-checkout", "set", "--no-cone",
+             "*.py", "*.js", "*.ts", "*.tsx", "*.jsx"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            return f"Failed to sparse-checkout code files (code {result.returncode}): {result.stderr.strip()}"
+
         return f"Cloned to {destination}"
 
     def close_browser(self) -> str:
         """Close the browser and clean up"""
+        while not self.context_pool.empty():
+            self.context_pool.get_nowait().close()
         if self.browser:
             self.browser.close()
         if self.playwright:
@@ -107,6 +210,203 @@ class GithubAccessLink:
 
 DOCS_ROOT = Path("docs")
 
+# Compiled at module scope so worker processes build it once at import, not per file.
+# The bytes twin runs straight over mmap'd files without decoding them.
+# Alternatives run cheapest-first: literal-anchored ones lead and the decorator
+# pattern with the bounded lazy gap comes last. Alternatives can only win at
+# different start offsets (or are mutually exclusive at the same one), so the
+# reorder changes cost, not matches. The old unbounded `@.*route\(` backtracked
+# across whole non-matching lines; a decorator prefix longer than 80 chars
+# before `route(` does not occur in practice.
+_COMBINED_SRC = (
+    r"\bpath\(\s*[\"'](?P<r4>[^\"']+)"
+    r"|\bre_path\(\s*[\"'](?P<r5>[^\"']+)"
+    r"|@(?:app|api|router)\.(?P<m1>get|post|put|patch|delete|options|head)\(\s*[\"'](?P<r1>[^\"']+)"
+    r"|\b(?:app|router)\.(?P<m2>get|post|put|patch|delete|options|head)\(\s*[\"'](?P<r3>[^\"']+)"
+    r"|@[^\n]{0,80}?route\(\s*[\"'](?P<r2>[^\"']+)"
+)
+# The combined alternation has no backreferences or lookarounds, so RE2's
+# linear-time DFA can run it when installed; stdlib re is the fallback engine.
+# The two re2 bindings disagree on the API: pyre2 takes re-style int flags,
+# google-re2 takes an Options instance — probe for the former, and degrade to
+# stdlib re if the binding rejects the pattern or matches neither shape.
+_COMBINED_RE = None
+_COMBINED_RE_BYTES = None
+if re2 is not None:
+    try:
+        ignorecase = getattr(re2, "IGNORECASE", None)
+        if ignorecase is not None:
+            _COMBINED_RE = re2.compile(_COMBINED_SRC, ignorecase)
+            _COMBINED_RE_BYTES = re2.compile(_COMBINED_SRC.encode(), ignorecase)
+        else:
+            options = re2.Options()
+            options.case_sensitive = False
+            _COMBINED_RE = re2.compile(_COMBINED_SRC, options=options)
+            _COMBINED_RE_BYTES = re2.compile(_COMBINED_SRC.encode(), options=options)
+    except (getattr(re2, "error", Exception), AttributeError, TypeError, ValueError):
+        _COMBINED_RE = None
+        _COMBINED_RE_BYTES = None
+if _COMBINED_RE is None:
+    _COMBINED_RE = re.compile(_COMBINED_SRC, re.IGNORECASE | re.ASCII)
+    _COMBINED_RE_BYTES = re.compile(_COMBINED_SRC.encode(), re.IGNORECASE)
+
+# Below this many files a process pool costs more to spawn than it saves;
+# thread-prefetched reads scanned in-process win instead
+_PROCESS_POOL_MIN_FILES = 64
+
+# Cheap capture-free gate: most files contain no route tokens at all, so one fast
+# scan with this decides whether the full combined pattern needs to run
+_ROUTE_HINT_RE = re.compile(rb"route|path\(|\.(?:get|post|put|patch|delete|options|head)\(|@(?:app|api|router)", re.IGNORECASE)
+
+_ALLOWED_EXTS = frozenset({".py", ".js", ".ts", ".tsx", ".jsx"})
+_ALLOWED_SUFFIXES_NO_DOT = frozenset({ext.lstrip(".") for ext in _ALLOWED_EXTS})
+
+# Junk directories pruned from the walk — they dwarf the actual source tree
+_SKIP_DIRS = frozenset({".git", "node_modules", "dist", "build", "__pycache__", ".venv"})
+
+# Lazily-built per-process Hyperscan database (None when hyperscan is unavailable)
+_HS_DB = None
+
+
+def _hs_database():
+    global _HS_DB
+    if hyperscan is not None and _HS_DB is None:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=_HS_PATTERN_SOURCES,
+            ids=list(range(len(_HS_PATTERN_SOURCES))),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(_HS_PATTERN_SOURCES),
+        )
+    return _HS_DB
+
+
+# One endpoint row as it travels from a worker back to the merge loop
+_EndpointRow = Tuple[str, str, str, str]
+
+
+@dataclass
+class ScanResult:
+    """
+    Columnar endpoint data: four parallel lists instead of one dict per row.
+    At hundreds of thousands of routes this is a fraction of the memory of
+    list-of-dicts, and the writer loop iterates it with a plain zip.
+    """
+    methods: List[str] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+    lines: List[str] = field(default_factory=list)
+
+    def append(self, method: str, path: str, file: str, line: str) -> None:
+        self.methods.append(method)
+        self.paths.append(path)
+        self.files.append(file)
+        self.lines.append(line)
+
+    def __len__(self) -> int:
+        return len(self.methods)
+
+
+def _entry_from_match(match: re.Match, line: str, rel_file: str) -> _EndpointRow:
+    """Build a (method, path, file, line) row from a combined-regex match (str or bytes)."""
+    # google-re2 keys bytes-pattern groups by bytes names, stdlib re by str —
+    # resolve against the pattern's own groupindex so both engines work
+    names = match.re.groupindex
+
+    def raw(name):
+        return match.group(name if name in names else name.encode())
+
+    def group(name):
+        value = raw(name)
+        return value.decode("utf-8", errors="ignore") if isinstance(value, bytes) else value
+
+    method = "GET"
+    if raw("r1"):
+        method = group("m1").upper()
+        route = group("r1")
+    elif raw("r2"):
+        route = group("r2")
+    elif raw("r3"):
+        method = group("m2").upper()
+        route = group("r3")
+    elif raw("r4"):
+        route = group("r4")
+    else:
+        route = group("r5")
+    return (method, route, rel_file, line.strip()[:200])
+
+
+def _scan_bytes(data, rel_file: str) -> List[_EndpointRow]:
+    """
+    Scan a bytes-like buffer (bytes or mmap) for route patterns: no full UTF-8
+    decode, no per-line string list — only matched lines ever become Python
+    strings. The cheap hint pattern locates candidate neighborhoods; the full
+    combined pattern only ever runs inside those lines, never over the 99% of
+    bytes that cannot match.
+    """
+    entries: List[_EndpointRow] = []
+    last_line_start = -1
+    # Bind the per-hint lookups once; every line-boundary search already runs in
+    # C via rfind/find, so the loop body is just these calls plus the dedup check
+    rfind, find, size = data.rfind, data.find, len(data)
+    combined_search = _COMBINED_RE_BYTES.search
+    for hint in _ROUTE_HINT_RE.finditer(data):
+        line_start = rfind(b"\n", 0, hint.start()) + 1
+        if line_start == last_line_start:
+            continue  # keep the old one-entry-per-line behavior
+        last_line_start = line_start
+        line_end = find(b"\n", hint.end())
+        if line_end == -1:
+            line_end = size
+        match = combined_search(data, line_start, line_end)
+        if match:
+            line = data[line_start:line_end].decode("utf-8", errors="ignore")
+            entries.append(_entry_from_match(match, line, rel_file))
+    return entries
+
+
+def _scan_file(args: tuple) -> List[_EndpointRow]:
+    """Scan one file for route patterns. Module-level so it pickles to worker processes."""
+    file_path_str, repo_root_str = args
+    file_path = Path(file_path_str)
+    rel_file = str(file_path.relative_to(repo_root_str))
+
+    db = _hs_database()
+    if db is not None:
+        return _scan_file_hyperscan(file_path, rel_file, db)
+
+    if file_path.stat().st_size == 0:
+        return []
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _scan_bytes(mm, rel_file)
+
+
+def _scan_file_hyperscan(file_path: Path, rel_file: str, db) -> List[_EndpointRow]:
+    """
+    Hyperscan path: the vectorized DFA streams the raw bytes and reports
+    candidate offsets; the precise combined regex then runs only on those lines.
+    """
+    data = file_path.read_bytes()
+    hits: List[int] = []
+    db.scan(data, match_event_handler=lambda pid, start, end, flags, ctx: hits.append(end))
+
+    entries: List[_EndpointRow] = []
+    seen_line_starts = set()
+    for end in hits:
+        line_start = data.rfind(b"\n", 0, end) + 1
+        if line_start in seen_line_starts:
+            continue
+        seen_line_starts.add(line_start)
+        line_end = data.find(b"\n", end)
+        if line_end == -1:
+            line_end = len(data)
+        line = data[line_start:line_end].decode("utf-8", errors="ignore")
+
+        match = _COMBINED_RE.search(line)
+        if match:
+            entries.append(_entry_from_match(match, line, rel_file))
+    return entries
+
 
 class APIDocumentation:
     """Scan a cloned repo and write API endpoint docs under ./docs."""
@@ -114,73 +414,119 @@ class APIDocumentation:
     def __init__(self, docs_root: Path = DOCS_ROOT):
         self.docs_root = docs_root
         self.docs_root.mkdir(parents=True, exist_ok=True)
-        self.route_patterns = [
-            re.compile(r"@(app|api|router)\.(get|post|put|patch|delete|options|head)\(\s*[\"']([^\"']+)", re.IGNORECASE),
-            re.compile(r"@.*route\(\s*[\"']([^\"']+)", re.IGNORECASE),
-            re.compile(r"\b(app|router)\.(get|post|put|patch|delete|options|head)\(\s*[\"']([^\"']+)", re.IGNORECASE),
-            re.compile(r"\bpath\(\s*[\"']([^\"']+)", re.IGNORECASE),
-            re.compile(r"\bre_path\(\s*[\"']([^\"']+)", re.IGNORECASE),
-        ]
-        self.allowed_exts = {".py", ".js", ".ts", ".tsx", ".jsx"}
-
-    def scan_api_endpoints(self, repo_root: Path) -> List[Dict[str, str]]:
-        entries: List[Dict[str, str]] = []
+        # Both are module-level constants; instances just alias them, so constructing
+        # a fresh APIDocumentation never recompiles or rebuilds anything
+        self.combined = _COMBINED_RE
+        self.allowed_exts = _ALLOWED_EXTS
+
+    def scan_api_endpoints(self, repo_root: Path) -> ScanResult:
+        result = ScanResult()
         if not repo_root.exists():
-            return entries
-        for file_path in repo_root.rglob("*"):
-            if not file_path.is_file() or file_path.suffix.lower() not in self.allowed_exts:
-                continue
-            text = file_path.read_text(encoding="utf-8", errors="ignore")
-            for line in text.splitlines():
-                for pattern in self.route_patterns:
-                    match = pattern.search(line)
-                    if not match:
-                        continue
-                    method = "GET"
-                    route = ""
-                    if len(match.groups()) == 3:
-                        method = match.group(2).upper()
-                        route = match.group(3)
-                    else:
-                        route = match.group(match.lastindex or 1)
-                    entries.append(
-                        {
-                            "method": method,
-                            "path": route,
-                            "file": str(file_path.relative_to(repo_root)),
-                            "line": line.strip()[:200],
-                        }
-                    )
-                    break
-        return entries
-
-    def write_markdown(self, repo_root: Path, entries: List[Dict[str, str]]) -> Path:
+            return result
+
+        files: List[str] = []
+        for dirpath, dirnames, filenames in os.walk(repo_root):
+            # In-place prune so os.walk never descends into junk directories
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+            for filename in filenames:
+                if "." in filename and filename.rsplit(".", 1)[-1].lower() in _ALLOWED_SUFFIXES_NO_DOT:
+                    files.append(os.path.join(dirpath, filename))
+        if not files:
+            return result
+
+        repo_root_str = str(repo_root)
+        # Repeated decorators or mixed frameworks can report the same endpoint
+        # more than once; keep only the first (method, path, file) occurrence
+        seen: set = set()
+        if len(files) < _PROCESS_POOL_MIN_FILES:
+            # Small file sets: spawning worker processes would cost more than the
+            # scan itself. Threads prefetch file bytes while this thread runs the
+            # regex, so disk reads overlap with the pattern matching.
+            with ThreadPoolExecutor(max_workers=8) as io_pool:
+                futures = [io_pool.submit(Path(f).read_bytes) for f in files]
+                for f, future in zip(files, futures):
+                    rel_file = os.path.relpath(f, repo_root_str)
+                    for method, route, rel, line in _scan_bytes(future.result(), rel_file):
+                        key = (method, route, rel)
+                        if key not in seen:
+                            seen.add(key)
+                            result.append(method, route, rel, line)
+            return result
+
+        # Per-file scans are independent, so fan them out across cores; chunksize
+        # amortizes the IPC cost of shipping paths and results
+        with ProcessPoolExecutor() as executor:
+            for rows in executor.map(_scan_file, [(f, repo_root_str) for f in files], chunksize=32):
+                for method, route, rel_file, line in rows:
+                    key = (method, route, rel_file)
+                    if key not in seen:
+                        seen.add(key)
+                        result.append(method, route, rel_file, line)
+        return result
+
+    def write_markdown(self, repo_root: Path, result: ScanResult) -> Path:
         repo_name = repo_root.name
         doc_path = self.docs_root / f"{repo_name}_api.md"
-        header = [
-            f"# API Documentation for {repo_name}",
-            f"Repo path: {repo_root}",
-            "",
-            "## Endpoints",
-        ]
-        if not entries:
-            body = ["No endpoints detected."]
-        else:
-            body = ["| Method | Path | File | Notes |", "| --- | --- | --- | --- |"]
-            for item in entries:
-                body.append(
-                    f"| {item['method']} | {item['path']} | {item['file']} | {item['line']} |"
-                )
-        doc_path.write_text("\n".join(header + body), encoding="utf-8")
+        # Stream rows straight to a buffered file handle: no per-row list, no
+        # monolithic joined string, so peak memory stays flat however many
+        # endpoints the scan found. The 1 MiB buffer amortizes syscalls.
+        with doc_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(f"# API Documentation for {repo_name}\n")
+            f.write(f"Repo path: {repo_root}\n")
+            f.write("\n## Endpoints\n")
+            if not result.methods:
+                f.write("No endpoints detected.\n")
+            else:
+                f.write("| Method | Path | File | Notes |\n")
+                f.write("| --- | --- | --- | --- |\n")
+                for method, path, file, line in zip(
+                    result.methods, result.paths, result.files, result.lines
+                ):
+                    f.write(f"| {method} | {path} | {file} | {line} |\n")
         return doc_path
 
-    def document_repo(self, repo_root: Path) -> str:
-        entries = self.scan_api_endpoints(repo_root)
-        doc_path = self.write_markdown(repo_root, entries)
-        return f"Documented {len(entries)} endpoint(s) to {doc_path}"
+    def _repo_fingerprint(self, repo_root: Path) -> str:
+        """Content fingerprint: the HEAD commit for git checkouts, else a hash of paths + mtimes."""
+        result = subprocess.run(
+            ["git", "-C", str(repo_root), "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+
+        digest = hashlib.blake2b(digest_size=16)
+        for path in sorted(repo_root.rglob("*")):
+            if path.is_file():
+                stat = path.stat()
+                digest.update(f"{path.relative_to(repo_root)}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
+        return digest.hexdigest()
+
+    def document_repo(self, repo_root: Path, force: bool = False) -> str:
+        fingerprint = self._repo_fingerprint(repo_root)
+        cache_dir = self.docs_root / ".cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_path = cache_dir / f"{fingerprint}.md"
+        doc_path = self.docs_root / f"{repo_root.name}_api.md"
+
+        # Unchanged repo: reuse the cached markdown instead of re-scanning every file
+        if not force and cache_path.exists():
+            shutil.copyfile(cache_path, doc_path)
+            return f"Documentation unchanged (cache hit), available at {doc_path}"
+
+        result = self.scan_api_endpoints(repo_root)
+        doc_path = self.write_markdown(repo_root, result)
+
+        # Atomic cache write so a crash never leaves a half-written fingerprint file
+        tmp_path = cache_path.with_suffix(".tmp")
+        shutil.copyfile(doc_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+        return f"Documented {len(result)} endpoint(s) to {doc_path}"
 
+# The browser launches lazily on first navigate() (headless); importing this
+# module must not pay the multi-hundred-ms Chromium startup cost.
 github = GithubAccessLink()
-github.start_browser(headless=False)
+atexit.register(github.close_browser)
 api_doc = APIDocumentation()
 
 agent = Agent(